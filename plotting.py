@@ -1,11 +1,18 @@
 import matplotlib
 import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
 import folium
+from PIL import Image
 import time
 import os
+import atexit
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 
 matplotlib.use("module://matplotlib_inline.backend_inline")
 plt.rcParams.update(
@@ -43,21 +50,22 @@ def plot_single_interactive_map(data, title="", save_html=None):
 
     group = folium.FeatureGroup(name="Detections")
 
-    for _, match in data.iterrows():
-        # marker (red)
-        popup = f"""
-            Detection<br>
-            Time: {match['timestamp']}<br>
-            Confidence: {match.get('confidence', 'N/A')}<br>
-            Brightness: {match.get('brightness', 'N/A')}
-        """
+    # Precomputed tooltips are cheaper than per-marker Popup objects in
+    # folium's template tree
+    tooltips = (
+        "Detection<br>"
+        + "Time: " + data["timestamp"].astype(str) + "<br>"
+        + "Confidence: " + _column_or_default(data, "confidence") + "<br>"
+        + "Brightness: " + _column_or_default(data, "brightness")
+    ).to_numpy()
+
+    # marker (red)
+    marker_style = {"radius": 6, "color": "red", "fill": True, "weight": 2}
+    lats = data["latitude"].to_numpy()
+    lons = data["longitude"].to_numpy()
+    for lat, lon, tooltip in zip(lats, lons, tooltips):
         folium.CircleMarker(
-            location=[match["latitude"], match["longitude"]],
-            radius=6,
-            color="red",
-            fill=True,
-            popup=popup,
-            weight=2,
+            location=[lat, lon], tooltip=tooltip, **marker_style
         ).add_to(group)
 
     group.add_to(m)
@@ -79,6 +87,91 @@ def plot_single_interactive_map(data, title="", save_html=None):
     return m
 
 
+def _marker_collection(lats, lons, color, popups=None):
+    """Build one folium.GeoJson layer of circle markers from coordinate arrays."""
+    if popups is None:
+        features = [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [lon, lat]},
+            }
+            for lat, lon in zip(lats, lons)
+        ]
+        popup = None
+    else:
+        features = [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [lon, lat]},
+                "properties": {"popup": popup},
+            }
+            for lat, lon, popup in zip(lats, lons, popups)
+        ]
+        popup = folium.GeoJsonPopup(fields=["popup"], labels=False)
+    return folium.GeoJson(
+        {"type": "FeatureCollection", "features": features},
+        marker=folium.CircleMarker(radius=6, fill=True, weight=2),
+        # fillColor must be set explicitly: the marker prototype bakes in the
+        # Leaflet default fill, unlike CircleMarker(color=...) which fills
+        # with the stroke color
+        style_function=lambda _, color=color: {"color": color, "fillColor": color},
+        popup=popup,
+    )
+
+
+def _column_or_default(df, column, default="N/A"):
+    # One column-existence check instead of a per-row lookup with a default,
+    # and no throwaway default Series when the column exists
+    if column in df.columns:
+        return df[column].astype(str)
+    return np.full(len(df), default)
+
+
+def _add_matches_to_map(matches_df, modis_target, viirs_target, lines_target=None, popups=True):
+    """
+    Add the MODIS (red) and VIIRS (blue) marker layers for a matches DataFrame
+    to maps or feature groups, plus the gray match lines if lines_target is given.
+    """
+    modis_lat = matches_df["modis_lat"].to_numpy()
+    modis_lon = matches_df["modis_lon"].to_numpy()
+    viirs_lat = matches_df["viirs_lat"].to_numpy()
+    viirs_lon = matches_df["viirs_lon"].to_numpy()
+
+    modis_popups = viirs_popups = None
+    if popups:
+        # Build the popup HTML with vectorized Series concatenation (C-level
+        # string ops) instead of one Python f-string per row
+        modis_popups = (
+            "MODIS Detection<br>"
+            + "Time: " + matches_df["modis_time"].astype(str) + "<br>"
+            + "Confidence: " + _column_or_default(matches_df, "modis_confidence") + "<br>"
+            + "Brightness: " + _column_or_default(matches_df, "modis_brightness") + "<br>"
+            + "Time Difference: " + matches_df["time_diff_minutes"].round(1).astype(str) + " min"
+        ).to_numpy()
+        viirs_popups = (
+            "VIIRS Detection<br>"
+            + "Time: " + matches_df["viirs_time"].astype(str) + "<br>"
+            + "Distance: " + matches_df["distance_km"].round(1).astype(str) + " km"
+        ).to_numpy()
+
+    _marker_collection(modis_lat, modis_lon, "red", modis_popups).add_to(modis_target)
+    _marker_collection(viirs_lat, viirs_lon, "blue", viirs_popups).add_to(viirs_target)
+
+    if lines_target is not None:
+        # All match lines as one MultiLineString feature instead of N PolyLines
+        line_coords = [
+            [[mlon, mlat], [vlon, vlat]]
+            for mlat, mlon, vlat, vlon in zip(modis_lat, modis_lon, viirs_lat, viirs_lon)
+        ]
+        folium.GeoJson(
+            {
+                "type": "Feature",
+                "geometry": {"type": "MultiLineString", "coordinates": line_coords},
+            },
+            style_function=lambda _: {"color": "gray", "weight": 1, "opacity": 0.5},
+        ).add_to(lines_target)
+
+
 def plot_matches_interactive_map(matches_df, title="", show_lines=True, save_html=None):
     """
     Create an interactive map showing MODIS and VIIRS detections with their matches.
@@ -92,68 +185,30 @@ def plot_matches_interactive_map(matches_df, title="", show_lines=True, save_htm
     folium.Map object
     """
     # Calculate center of Germany
-    center_lat = (matches_df["modis_lat"].mean() + matches_df["viirs_lat"].mean()) / 2
-    center_lon = (matches_df["modis_lon"].mean() + matches_df["viirs_lon"].mean()) / 2
+    center_lat = np.concatenate(
+        [matches_df["modis_lat"].to_numpy(), matches_df["viirs_lat"].to_numpy()]
+    ).mean()
+    center_lon = np.concatenate(
+        [matches_df["modis_lon"].to_numpy(), matches_df["viirs_lon"].to_numpy()]
+    ).mean()
 
     m = folium.Map(
         location=[center_lat, center_lon],
         zoom_start=6,
         tiles="CartoDB positron",  # Light theme map
+        prefer_canvas=True,  # render markers on a canvas instead of SVG nodes
     )
 
     # Create feature groups for different layers
     modis_group = folium.FeatureGroup(name="MODIS Detections")
     viirs_group = folium.FeatureGroup(name="VIIRS Detections")
-    lines_group = folium.FeatureGroup(name="Matches")
-
-    for _, match in matches_df.iterrows():
-        # MODIS marker (red)
-        modis_popup = f"""
-            MODIS Detection<br>
-            Time: {match['modis_time']}<br>
-            Confidence: {match.get('modis_confidence', 'N/A')}<br>
-            Brightness: {match.get('modis_brightness', 'N/A')}<br>
-            Time Difference: {match['time_diff_minutes']:.1f} min
-        """
-        folium.CircleMarker(
-            location=[match["modis_lat"], match["modis_lon"]],
-            radius=6,
-            color="red",
-            fill=True,
-            popup=modis_popup,
-            weight=2,
-        ).add_to(modis_group)
-
-        # VIIRS marker (blue)
-        viirs_popup = f"""
-            VIIRS Detection<br>
-            Time: {match['viirs_time']}<br>
-            Distance: {match['distance_km']:.1f} km
-        """
-        folium.CircleMarker(
-            location=[match["viirs_lat"], match["viirs_lon"]],
-            radius=6,
-            color="blue",
-            fill=True,
-            popup=viirs_popup,
-            weight=2,
-        ).add_to(viirs_group)
-
-        # Line between matches
-        if show_lines:
-            folium.PolyLine(
-                locations=[
-                    [match["modis_lat"], match["modis_lon"]],
-                    [match["viirs_lat"], match["viirs_lon"]],
-                ],
-                color="gray",
-                weight=1,
-                opacity=0.5,
-            ).add_to(lines_group)
+    lines_group = folium.FeatureGroup(name="Matches") if show_lines else None
+
+    _add_matches_to_map(matches_df, modis_group, viirs_group, lines_group)
 
     modis_group.add_to(m)
     viirs_group.add_to(m)
-    if show_lines:
+    if lines_group is not None:
         lines_group.add_to(m)
 
     folium.LayerControl().add_to(m)
@@ -187,35 +242,7 @@ def _create_matches_map_for_screenshot(
         tiles="CartoDB positron",
     )
 
-    for _, match in matches_df.iterrows():
-        # MODIS marker (red)
-        folium.CircleMarker(
-            location=[match["modis_lat"], match["modis_lon"]],
-            radius=6,
-            color="red",
-            fill=True,
-            weight=2,
-        ).add_to(m)
-
-        # VIIRS marker (blue)
-        folium.CircleMarker(
-            location=[match["viirs_lat"], match["viirs_lon"]],
-            radius=6,
-            color="blue",
-            fill=True,
-            weight=2,
-        ).add_to(m)
-
-        if show_lines:
-            folium.PolyLine(
-                locations=[
-                    [match["modis_lat"], match["modis_lon"]],
-                    [match["viirs_lat"], match["viirs_lon"]],
-                ],
-                color="gray",
-                weight=1,
-                opacity=0.5,
-            ).add_to(m)
+    _add_matches_to_map(matches_df, m, m, m if show_lines else None, popups=False)
 
     legend_html = """
             <div style="position: absolute;
@@ -242,53 +269,31 @@ def _create_single_map_for_screenshot(data, center_coords, zoom_level=13):
         tiles="CartoDB positron",
     )
 
-    for _, detection in data.iterrows():
-        # marker (red)
+    # marker (red)
+    marker_style = {"radius": 6, "color": "red", "fill": True, "weight": 2}
+    for detection in data.itertuples(index=False):
         folium.CircleMarker(
-            location=[detection["latitude"], detection["longitude"]],
-            radius=6,
-            color="red",
-            fill=True,
-            weight=2,
+            location=[detection.latitude, detection.longitude], **marker_style
         ).add_to(m)
     return m
 
 
-def create_map_screenshot(
-    type: str,
-    data,
-    center_coords,
-    zoom_level=13,
-    width=800,
-    height=600,
-    output_file="map.png",
-    show_lines=True,
-):
-    """
-    Create a static screenshot of a map centered on specific coordinates.
-
-    Parameters:
-    matches_df: DataFrame with matches (same format as in plot_matches_map)
-    center_coords: tuple of (latitude, longitude) for the map center
-    zoom_level: int, zoom level (higher numbers = more zoomed in)
-    width: int, width of the output image in pixels
-    height: int, height of the output image in pixels
-    output_file: str, path where to save the PNG file
-    show_lines: bool, whether to show the gray lines between matches
-    """
-    m = (
+def _build_screenshot_map(type, data, center_coords, zoom_level, show_lines):
+    return (
         _create_matches_map_for_screenshot(data, center_coords, zoom_level, show_lines)
         if type == "matches"
         else (_create_single_map_for_screenshot(data, center_coords, zoom_level))
     )
 
+
+def _add_screenshot_css(m, width, height):
     css = """
     <style>
         body {
             margin: 0;
             padding: 0;
         }
-        #map {
+        #%s {
             position: fixed !important;
             width: %dpx !important;
             height: %dpx !important;
@@ -298,90 +303,220 @@ def create_map_screenshot(
         }
     </style>
     """ % (
+        m.get_name(),
         width,
         height,
     )
+    m.get_root().header.add_child(folium.Element(css))
 
-    html = f"""
-    <!DOCTYPE html>
-    <head>{css}</head>
-    <body>
-        <div id="map"></div>
-        {m.get_root().render()}
-    </body>
-    </html>
-    """
-
-    temp_html = "temp_map.html"
-    with open(temp_html, "w") as f:
-        f.write(html)
 
+def _create_browser(width, height):
     chrome_options = Options()
+    # 'eager' returns from get() at DOMContentLoaded; the explicit tile wait
+    # below covers the rest
+    chrome_options.page_load_strategy = "eager"
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--no-first-run")
+    chrome_options.add_argument("--no-default-browser-check")
     chrome_options.add_argument(f"--window-size={width},{height}")
+    return webdriver.Chrome(options=chrome_options)
 
-    browser = webdriver.Chrome(options=chrome_options)
-    browser.get(f"file://{os.path.abspath(temp_html)}")
 
-    # Wait for map tiles to load
-    time.sleep(3)
-    browser.save_screenshot(output_file)
-    browser.quit()
-    os.remove(temp_html)
+_browser = None
 
 
-def plot_histogram(matches, dataset_name):
-    # Histogram of time differences
-    plt.figure(figsize=(10, 6))
-    sns.histplot(data=matches, x="time_diff_minutes", bins=30, color="blue", alpha=0.6)
-    plt.xlabel(
-        f"Time Difference (minutes)\nNegative = {dataset_name} Earlier, Positive = VIIRS Earlier"
-    )
-    plt.ylabel("Count")
+def _get_browser(width, height):
+    # Lazily create one headless browser and keep it alive for the whole
+    # session instead of paying Chrome startup/teardown per screenshot
+    global _browser
+    if _browser is None:
+        _browser = _create_browser(width, height)
+        atexit.register(_browser.quit)
+    else:
+        _browser.set_window_size(width, height)
+    return _browser
 
-    # Add vertical line at 0
-    plt.axvline(x=0, color="red", linestyle="--", alpha=0.5)
 
-    plt.tight_layout()
-    plt.savefig(
-        f'latex_plots/histogram_{dataset_name.lower().replace(" ", "_")}.pgf',
-        format="pgf",
+def _wait_for_tiles(browser, timeout=5):
+    # Poll until the page finished loading and no Leaflet tile is still pending
+    tiles_loaded = (
+        "return document.readyState === 'complete'"
+        " && document.querySelectorAll('.leaflet-tile').length > 0"
+        " && document.querySelectorAll('.leaflet-tile:not(.leaflet-tile-loaded)').length === 0"
     )
-    # dont show the title for latex plots
-    plt.title(f"Distribution of Detection Time Differences ({dataset_name} vs. VIIRS)")
-    plt.show()
+    try:
+        WebDriverWait(browser, timeout).until(lambda d: d.execute_script(tiles_loaded))
+    except TimeoutException:
+        # Give slow tile servers one last chance instead of failing the capture
+        time.sleep(1)
+
+
+def _capture_screenshot(browser, m, output_file):
+    # A unique temp file per capture, so parallel workers don't clobber each other
+    with tempfile.NamedTemporaryFile("w", suffix=".html", delete=False) as f:
+        temp_html = f.name
+    # save() renders the page once, avoiding a second get_root().render() pass
+    m.save(temp_html)
+
+    browser.get(f"file://{temp_html}")
+
+    _wait_for_tiles(browser)
+    # Capture just the map div: a tighter crop than the full window and
+    # less pixel data through the WebDriver bridge
+    browser.find_element(By.ID, m.get_name()).screenshot(output_file)
+    os.remove(temp_html)
+
+
+def create_map_screenshot(
+    type: str,
+    data,
+    center_coords,
+    zoom_level=13,
+    width=800,
+    height=600,
+    output_file="map.png",
+    show_lines=True,
+):
+    """
+    Create a static screenshot of a map centered on specific coordinates.
 
+    Parameters:
+    matches_df: DataFrame with matches (same format as in plot_matches_map)
+    center_coords: tuple of (latitude, longitude) for the map center
+    zoom_level: int, zoom level (higher numbers = more zoomed in)
+    width: int, width of the output image in pixels
+    height: int, height of the output image in pixels
+    output_file: str, path where to save the PNG file
+    show_lines: bool, whether to show the gray lines between matches
+    """
+    m = _build_screenshot_map(type, data, center_coords, zoom_level, show_lines)
+
+    _add_screenshot_css(m, width, height)
+    browser = _get_browser(width, height)
+    _capture_screenshot(browser, m, output_file)
+
+
+def _screenshot_worker(jobs):
+    # Runs in a worker process; reuses one headless browser for its whole chunk
+    browser = None
+    try:
+        for job in jobs:
+            job = dict(job)
+            width = job.setdefault("width", 800)
+            height = job.setdefault("height", 600)
+            if browser is None:
+                browser = _create_browser(width, height)
+            else:
+                browser.set_window_size(width, height)
+            m = _build_screenshot_map(
+                job["type"],
+                job["data"],
+                job["center_coords"],
+                job.get("zoom_level", 13),
+                job.get("show_lines", True),
+            )
+            _add_screenshot_css(m, width, height)
+            _capture_screenshot(browser, m, job["output_file"])
+    finally:
+        if browser is not None:
+            browser.quit()
+
+
+def create_map_screenshots(jobs, max_workers=None):
+    """
+    Create many map screenshots in parallel.
 
-def plot_time_distance(matches, dataset_name):
-    # Time differences vs. Distance
-    plt.figure(figsize=(10, 6))
-    sns.scatterplot(data=matches, x="distance_km", y="time_diff_minutes", alpha=0.5)
-    plt.xlabel("Distance between detections (km)")
-    plt.ylabel("Time Difference (minutes)")
+    Parameters:
+    jobs: list of dicts with the same keys as the create_map_screenshot
+          parameters; output_file is required per job so jobs can't silently
+          overwrite each other
+    max_workers: int or None, number of worker processes (defaults to the CPU count)
+
+    Each worker process keeps a single headless browser alive for its whole
+    chunk of jobs, so the 1-2s Chrome startup is paid once per core instead
+    of once per screenshot.
+    """
+    if not jobs:
+        return
+
+    for i, job in enumerate(jobs):
+        if "output_file" not in job:
+            raise ValueError(f"job {i} is missing the required 'output_file' key")
+
+    max_workers = max_workers or os.cpu_count()
+    chunks = [jobs[i::max_workers] for i in range(max_workers)]
+    chunks = [chunk for chunk in chunks if chunk]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        futures = [executor.submit(_screenshot_worker, chunk) for chunk in chunks]
+        for future in futures:
+            future.result()
+
+
+def plot_histogram(matches, dataset_name, show=True):
+    # Histogram of time differences; pre-binned with numpy to skip the
+    # seaborn/pandas plotting overhead
+    slug = dataset_name.lower().replace(" ", "_")
+    fig, ax = plt.subplots(figsize=(10, 6))
+    counts, edges = np.histogram(matches["time_diff_minutes"].to_numpy(), bins=30)
+    ax.bar(
+        edges[:-1], counts, width=np.diff(edges), align="edge", color="blue", alpha=0.6
+    )
+    ax.set_xlabel(
+        f"Time Difference (minutes)\nNegative = {dataset_name} Earlier, Positive = VIIRS Earlier"
+    )
+    ax.set_ylabel("Count")
 
-    plt.tight_layout()
-    plt.savefig(
-        f'latex_plots/time_distance_{dataset_name.lower().replace(" ", "_")}.pgf',
-        format="pgf",
+    # Add vertical line at 0
+    ax.axvline(x=0, color="red", linestyle="--", alpha=0.5)
+
+    fig.tight_layout()
+    fig.savefig(f"latex_plots/histogram_{slug}.pgf", format="pgf")
+    if show:
+        # dont show the title for latex plots
+        ax.set_title(
+            f"Distribution of Detection Time Differences ({dataset_name} vs. VIIRS)"
+        )
+        plt.show()
+    plt.close(fig)
+
+
+def plot_time_distance(matches, dataset_name, show=True):
+    # Time differences vs. Distance; hexbin aggregates the points so the
+    # PGF output stays small instead of one SVG point per match
+    slug = dataset_name.lower().replace(" ", "_")
+    fig, ax = plt.subplots(figsize=(10, 6))
+    bins = ax.hexbin(
+        matches["distance_km"].to_numpy(),
+        matches["time_diff_minutes"].to_numpy(),
+        gridsize=50,
+        cmap="Blues",
+        mincnt=1,
     )
-    # dont show the title for latex plots
-    plt.title(f"Time Difference vs. Spatial Distance ({dataset_name} vs. VIIRS)")
-    plt.show()
+    fig.colorbar(bins, ax=ax, label="Matches per bin")
+    ax.set_xlabel("Distance between detections (km)")
+    ax.set_ylabel("Time Difference (minutes)")
+
+    fig.tight_layout()
+    fig.savefig(f"latex_plots/time_distance_{slug}.pgf", format="pgf")
+    if show:
+        # dont show the title for latex plots
+        ax.set_title(f"Time Difference vs. Spatial Distance ({dataset_name} vs. VIIRS)")
+        plt.show()
+    plt.close(fig)
 
 
 def show_screenshots(path1, path2, title1, title2):
-    # display the maps
-    plt.figure(figsize=(12, 8))
-    plt.subplot(1, 2, 1)
-    plt.imshow(plt.imread(path1))
-    plt.axis("off")
-    plt.title(title1)
-
-    plt.subplot(1, 2, 2)
-    plt.imshow(plt.imread(path2))
-    plt.axis("off")
-    plt.title(title2)
-
-    plt.tight_layout()
+    # display the maps; PIL keeps the pixels as uint8 instead of the
+    # float64 arrays plt.imread decodes PNGs into
+    fig, axes = plt.subplots(1, 2, figsize=(12, 8))
+    for ax, path, title in zip(axes, (path1, path2), (title1, title2)):
+        ax.imshow(np.asarray(Image.open(path)))
+        ax.axis("off")
+        ax.set_title(title)
+
+    fig.tight_layout()
     plt.show()